@@ -3,27 +3,65 @@ MongoDB connection and collection management module.
 Provides singleton connection manager and collection access functions.
 """
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
+from pymongo import UpdateOne
 from pymongo.mongo_client import MongoClient
 from pymongo.server_api import ServerApi
 from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.errors import OperationFailure
 from dotenv import load_dotenv
+import atexit
+import hashlib
 import os
 from logfire import Logfire
 
 # Initialize logging
 logger = Logfire()
 
+# Resolve connection settings once at import
+load_dotenv()
+MONGODB_URI = os.getenv('MONGODB_URI')
+
+# Key pattern of the job deduplication index
+JOB_DEDUP_INDEX = [('doc_hash', 1)]
+
+# Four-field unique index that doc_hash replaced; dropped by ensure_indexes
+LEGACY_JOB_DEDUP_INDEX = [
+    ('title', 1),
+    ('company_name', 1),
+    ('location', 1),
+    ('apply_link', 1)
+]
+
+BACKFILL_BATCH_SIZE = 1000  # Listings updated per bulk_write when adding doc_hash
+
+def job_doc_hash(title: str, company_name: str, location: str, apply_link: str) -> str:
+    """
+    Compute the deduplication key for a job listing.
+    
+    A fixed-size digest keeps the unique index small compared to indexing the
+    four fields (including the full apply URL) directly.
+    
+    Returns:
+        str: 32-character hex digest
+    """
+    key = "|".join((title, company_name, location, apply_link))
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
 class MongoDB:
     """
     MongoDB connection manager implementing singleton pattern.
     
     Manages database connection and provides access to collections.
-    Ensures single database connection is maintained throughout the application.
+    Ensures single database connection is maintained per process. Clients are
+    keyed by PID because MongoClient is not fork-safe: a forked child gets its
+    own client instead of reusing the parent's sockets. Collection handles are
+    cached per process alongside the client.
     """
     _instance: Optional['MongoDB'] = None
-    _client: Optional[MongoClient] = None
+    _clients: Dict[int, MongoClient] = {}
+    _collections: Dict[Tuple[int, str, str], Collection] = {}
     
     def __new__(cls):
         """Singleton pattern to ensure single database connection"""
@@ -36,34 +74,36 @@ class MongoDB:
         if self._client is None:
             self._connect()
     
+    @property
+    def _client(self) -> Optional[MongoClient]:
+        """MongoClient owned by the current process, if connected"""
+        return self._clients.get(os.getpid())
+    
     def _connect(self):
         """
         Establish connection to MongoDB using credentials from environment variables.
         """
-        load_dotenv()
-        
-        uri = os.getenv('MONGODB_URI')
+        uri = MONGODB_URI
         if not uri:
             raise ValueError("MongoDB URI not found in environment variables")
         
         # Debug log to see what URI we're using (with masked password)
         masked_uri = uri.replace(os.getenv('MONGODB_PASSWORD', ''), '***')
-        logger.info(f"Attempting to connect with URI: {masked_uri}")
+        logger.info("Attempting to connect", uri=masked_uri)
         
         try:
-            self._client = MongoClient(uri, 
-                                     server_api=ServerApi('1'),
-                                     serverSelectionTimeoutMS=5000)  # 5 second timeout
+            client = MongoClient(uri, 
+                                 server_api=ServerApi('1'),
+                                 serverSelectionTimeoutMS=5000)  # 5 second timeout
             # Test connection
-            self._client.admin.command('ping')
+            client.admin.command('ping')
+            self._clients[os.getpid()] = client
             logger.info("Successfully connected to MongoDB!")
             
-            # Ensure indexes exist after successful connection
-            self.ensure_indexes()
-            
         except Exception as e:
-            logger.error(f"Failed to connect to MongoDB: {str(e)}")
-            logger.error(f"Error type: {type(e)}")
+            logger.error("Failed to connect to MongoDB",
+                        error=str(e),
+                        error_type=type(e).__name__)
             raise
     
     def get_collection(self, db_name: str, collection_name: str) -> Collection:
@@ -80,28 +120,68 @@ class MongoDB:
         Raises:
             ConnectionError: If MongoDB connection cannot be established
         """
-        if not self._client:
+        key = (os.getpid(), db_name, collection_name)
+        collection = self._collections.get(key)
+        if collection is not None:
+            return collection
+        
+        client = self._client
+        if client is None:
             self._connect()
+            client = self._client
             
-        if not self._client:  # If still None after connection attempt
+        if client is None:  # If still None after connection attempt
             raise ConnectionError("Failed to establish MongoDB connection")
             
-        db: Database = self._client.get_database(db_name)
-        return db.get_collection(collection_name)
+        db: Database = client.get_database(db_name)
+        collection = db.get_collection(collection_name)
+        self._collections[key] = collection
+        return collection
     
     def close(self):
-        """Close MongoDB connection and cleanup resources."""
-        if self._client:
-            self._client.close()
-            self._client = None
+        """Close this process's MongoDB connection and cleanup resources."""
+        pid = os.getpid()
+        for key in [key for key in self._collections if key[0] == pid]:
+            del self._collections[key]
+        client = self._clients.pop(pid, None)
+        if client is not None:
+            client.close()
             logger.info("MongoDB connection closed")
     
+    def _backfill_job_hashes(self, jobs_collection: Collection) -> int:
+        """
+        Add `doc_hash` to job listings stored before it was introduced.
+        
+        Returns:
+            int: Number of documents updated
+        """
+        fields = {"title": 1, "company_name": 1, "location": 1, "apply_link": 1}
+        cursor = jobs_collection.find({"doc_hash": {"$exists": False}}, fields)
+        
+        updated = 0
+        operations = []
+        for doc in cursor:
+            doc_hash = job_doc_hash(doc.get("title", ""), doc.get("company_name", ""),
+                                    doc.get("location", ""), doc.get("apply_link", ""))
+            operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"doc_hash": doc_hash}}))
+            if len(operations) >= BACKFILL_BATCH_SIZE:
+                updated += jobs_collection.bulk_write(operations, ordered=False).modified_count
+                operations = []
+        if operations:
+            updated += jobs_collection.bulk_write(operations, ordered=False).modified_count
+        return updated
+    
     def ensure_indexes(self):
         """
         Create recommended indexes for job-related collections.
         
         Creates indexes for job deduplication, search references, timestamps,
-        and search metadata to optimize query performance.
+        and search metadata to optimize query performance. Not run on connect;
+        use backend/scripts/bootstrap_indexes.py once per deployment.
+        
+        Also migrates job deduplication to `doc_hash`: listings stored without
+        one are backfilled and the legacy four-field index is dropped. Until
+        this has run, upserts miss older listings and collide with that index.
         
         Returns:
             bool: True if indexes created successfully, False otherwise
@@ -110,13 +190,20 @@ class MongoDB:
             jobs_collection = self.get_collection('jobs_db', 'job_listings')
             searches_collection = self.get_collection('jobs_db', 'job_searches')
             
-            # 1. Compound unique index for job deduplication
-            jobs_collection.create_index([
-                ('title', 1),
-                ('company_name', 1),
-                ('location', 1),
-                ('apply_link', 1)
-            ], unique=True)
+            # 1. Unique content hash index for job deduplication, built after
+            #    existing listings get their doc_hash. Partial, so a listing
+            #    written without one by older code can't block the build
+            backfilled = self._backfill_job_hashes(jobs_collection)
+            logger.info("Backfilled doc_hash on job listings", count=backfilled)
+            jobs_collection.create_index(
+                JOB_DEDUP_INDEX,
+                unique=True,
+                partialFilterExpression={'doc_hash': {'$exists': True}}
+            )
+            try:
+                jobs_collection.drop_index(LEGACY_JOB_DEDUP_INDEX)
+            except OperationFailure:
+                pass  # Already dropped or never created
             
             # 2. Search reference index
             jobs_collection.create_index([('search_id', 1)])
@@ -134,11 +221,12 @@ class MongoDB:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to create MongoDB indexes: {str(e)}")
+            logger.error("Failed to create MongoDB indexes", error=str(e))
             return False
 
 # Create a global instance
 mongodb = MongoDB()
+atexit.register(mongodb.close)
 
 def get_jobs_collection() -> Collection:
     """
@@ -1,11 +1,18 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Any, List, Optional
+from enum import Enum
+from pydantic import BaseModel, Field, HttpUrl, field_validator
 from datetime import datetime
 
+class SearchStatus(str, Enum):
+    """Status values reported in search metadata"""
+    success = "success"
+    error = "error"
+    pending = "pending"
+
 class SearchMetadata(BaseModel):
     """Metadata about the search request and response"""
     id: str = Field(..., min_length=1)
-    status: str = Field(..., pattern="(?i)^(success|Success|error|pending)$")
+    status: SearchStatus
     created_at: datetime
     request_time_taken: float = Field(..., ge=0)
     parsing_time_taken: float = Field(..., ge=0)
@@ -14,6 +21,12 @@ class SearchMetadata(BaseModel):
     html_url: HttpUrl
     json_url: HttpUrl
 
+    @field_validator('status', mode='before')
+    @classmethod
+    def normalize_status(cls, value: Any) -> Any:
+        """Accept any casing of the status (the API reports e.g. "Success")"""
+        return value.lower() if isinstance(value, str) else value
+
 class SearchParameters(BaseModel):
     """Parameters used for the search"""
     engine: str
@@ -79,5 +92,5 @@ class JobSearchDocument(BaseModel):
     total_jobs: int = 0
     pages_processed: int = 0
     jobs: List[str] = []  # List of job IDs that were found in this search
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
\ No newline at end of file
+    created_at: datetime  # Set by the caller so a whole batch shares one timestamp
+    updated_at: datetime
\ No newline at end of file
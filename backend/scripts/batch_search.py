@@ -5,13 +5,12 @@ from pathlib import Path
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(project_root))
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 import itertools
 from typing import List, Tuple, Dict, Optional
 from datetime import datetime, UTC
-from backend.utils.job_search import process_job_search
+from backend.utils.job_search import process_job_search, SEARCH_API_CALLS_PER_MINUTE
 from backend.utils.logger import logger
-import time
 
 #!/usr/bin/env python3
 
@@ -20,7 +19,6 @@ JOB_TITLES = [
     "AI Engineer",
     "Applied Data Scientist",
     "Machine Learning Engineer",
-    "Applied Data Scientist",
     "Prompt Engineer",
     "NLP Engineer",
 ]
@@ -33,8 +31,7 @@ LOCATIONS = [
     "Remote",
 ]
 
-MAX_WORKERS = 3  # Conservative number of concurrent threads
-RATE_LIMIT = 1.0  # More conservative rate limit (1 second)
+MAX_WORKERS = 3  # Conservative number of concurrent searches
 MAX_PAGE_DEPTH = 3  # Consistent with previous testing
 
 # Add the project root to the Python path
@@ -85,14 +82,44 @@ def run_search(args: Tuple[str, str]) -> Optional[Dict]:
                     duration_seconds=(datetime.now(UTC) - start_time).total_seconds())
         return None
 
-def main():
+def unique_search_pairs(job_titles: List[str], locations: List[str]) -> List[Tuple[str, str]]:
+    """
+    Build the title/location pairs to search, skipping duplicates.
+    
+    Pairs are compared case- and whitespace-insensitively so the same query
+    is never sent to the API twice in one batch. Order is preserved.
+    """
+    seen = set()
+    pairs = []
+    for job_title, location in itertools.product(job_titles, locations):
+        key = (" ".join(job_title.split()).lower(), " ".join(location.split()).lower())
+        if key not in seen:
+            seen.add(key)
+            pairs.append((job_title, location))
+    return pairs
+
+async def run_search_async(
+    pair: Tuple[str, str],
+    semaphore: asyncio.Semaphore
+) -> Optional[Dict]:
+    """
+    Run a single search once a concurrency slot is free.
+    
+    The blocking search runs in a worker thread so the event loop keeps
+    scheduling the other searches while it waits on the network. Rate
+    limiting is applied per API request inside fetch_jobs_from_api.
     """
-    Run batch job searches using ThreadPoolExecutor with rate limiting.
+    async with semaphore:
+        return await asyncio.to_thread(run_search, pair)
+
+async def run_batch() -> None:
+    """
+    Run batch job searches concurrently with asyncio and rate limiting.
     """
     start_time = datetime.now(UTC)
     
-    # Create all search combinations
-    search_pairs = list(itertools.product(JOB_TITLES, LOCATIONS))
+    # Create all distinct search combinations
+    search_pairs = unique_search_pairs(JOB_TITLES, LOCATIONS)
     total_searches = len(search_pairs)
     
     logger.info("Starting batch search", 
@@ -100,41 +127,37 @@ def main():
                 job_titles=len(JOB_TITLES),
                 locations=len(LOCATIONS),
                 max_workers=MAX_WORKERS,
-                rate_limit_seconds=RATE_LIMIT)
+                calls_per_minute=SEARCH_API_CALLS_PER_MINUTE)
 
     successful_searches = 0
     failed_searches = 0
     
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        # Submit all searches
-        futures = {}
-        for pair in search_pairs:
-            # Add small delay between submissions for rate limiting
-            time.sleep(RATE_LIMIT)
-            futures[executor.submit(run_search, pair)] = pair
-        
-        # Process results as they complete
-        for future in as_completed(futures):
-            job_title, location = futures[future]
-            try:
-                result = future.result()
-                if result:
-                    successful_searches += 1
-                    logger.info("Search completed successfully", 
-                              job_title=job_title,
-                              location=location,
-                              jobs_found=result["total_jobs"])
-                else:
-                    failed_searches += 1
-                    logger.warning("Search completed with no results",
-                                 job_title=job_title,
-                                 location=location)
-            except Exception as e:
-                failed_searches += 1
-                logger.error("Search failed unexpectedly",
-                           job_title=job_title,
-                           location=location,
-                           error=str(e))
+    # All searches are scheduled up front; the semaphore caps concurrency
+    # while the API rate limit is enforced at each outbound request
+    semaphore = asyncio.Semaphore(MAX_WORKERS)
+    results = await asyncio.gather(
+        *(run_search_async(pair, semaphore) for pair in search_pairs),
+        return_exceptions=True
+    )
+    
+    for (job_title, location), result in zip(search_pairs, results):
+        if isinstance(result, Exception):
+            failed_searches += 1
+            logger.error("Search failed unexpectedly",
+                       job_title=job_title,
+                       location=location,
+                       error=str(result))
+        elif result:
+            successful_searches += 1
+            logger.info("Search completed successfully", 
+                      job_title=job_title,
+                      location=location,
+                      jobs_found=result["total_jobs"])
+        else:
+            failed_searches += 1
+            logger.warning("Search completed with no results",
+                         job_title=job_title,
+                         location=location)
 
     duration = (datetime.now(UTC) - start_time).total_seconds()
     logger.info("Batch search completed", 
@@ -143,5 +166,11 @@ def main():
                 total_duration_seconds=duration,
                 searches_per_second=total_searches/duration)
 
+def main():
+    """
+    Run batch job searches.
+    """
+    asyncio.run(run_batch())
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,23 @@
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(project_root))
+
+from backend.database.mongodb_jobfocus import mongodb
+
+def bootstrap_indexes():
+    """
+    Create the MongoDB indexes used by the job search pipeline.
+    
+    Run once per deployment (and after index changes) instead of on every connect.
+    Must run before deploying the `doc_hash` deduplication change, since it also
+    backfills `doc_hash` on existing job listings.
+    """
+    if not mongodb.ensure_indexes():
+        sys.exit(1)
+    print("MongoDB indexes are in place")
+
+if __name__ == "__main__":
+    bootstrap_indexes()
@@ -5,8 +5,11 @@ from pathlib import Path
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(project_root))
 
+from itertools import islice
 from backend.database.mongodb_jobfocus import mongodb
 from bson import ObjectId
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
 
 # List of ObjectIds for the specific job listings we want to copy
 TARGET_IDS = [
@@ -17,6 +20,20 @@ TARGET_IDS = [
     "67916c3422f97cda282a027b",  # Khan Academy
 ]
 
+COPY_BATCH_SIZE = 1000  # Documents held in memory at once by the fallback copy
+
+def copy_documents(source_collection: Collection, target_collection: Collection, query: dict):
+    """
+    Copy matching documents through the client in bounded batches.
+    
+    Fallback for deployments where $out is unavailable. The cursor is consumed
+    one batch at a time so the full result set is never materialized.
+    """
+    target_collection.drop()
+    cursor = source_collection.find(query).batch_size(COPY_BATCH_SIZE)
+    while batch := list(islice(cursor, COPY_BATCH_SIZE)):
+        target_collection.insert_many(batch, ordered=False)
+
 def create_test_listings():
     """
     Create a test collection by copying specific job listings from the main collection.
@@ -24,16 +41,17 @@ def create_test_listings():
     source_collection = mongodb.get_collection('jobs_db', 'job_listings')
     test_collection = mongodb.get_collection('jobs_db', 'test_job_listings')
     
-    # Drop existing test collection if it exists
-    test_collection.drop()
-    
-    # Query the source collection for our specific documents
+    # Copy our specific documents server-side; $out replaces any existing
+    # test collection, so no separate drop or client round trip is needed
     query = {"_id": {"$in": [ObjectId(id_) for id_ in TARGET_IDS]}}
-    documents = source_collection.find(query)
-    
-    # Insert the documents into the test collection
-    if documents:
-        test_collection.insert_many(list(documents))
+    try:
+        source_collection.aggregate([
+            {"$match": query},
+            {"$out": test_collection.name}
+        ])
+    except OperationFailure as e:
+        print(f"$out unavailable ({e}), copying through the client instead")
+        copy_documents(source_collection, test_collection, query)
     
     # Verify the insertion
     count = test_collection.count_documents({})
@@ -1,24 +1,141 @@
 from typing import List, Optional, Dict, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, UTC
 import requests
+from requests.adapters import HTTPAdapter
 import os
 from dotenv import load_dotenv
+from backend.utils.cache import TTLCache
 from backend.utils.logger import logger
-from backend.database.mongodb_jobfocus import get_jobs_collection, get_searches_collection
-from backend.models.job_search_models import JobSearchResponse, JobSearchDocument
+from backend.utils.rate_limiter import RateLimiter
+from backend.database.mongodb_jobfocus import get_jobs_collection, job_doc_hash
+from backend.models.job_search_models import JobSearchResponse, JobListing
 from pydantic import ValidationError
+from pydantic_core import from_json
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+# Resolve API configuration once at import rather than on every request
+load_dotenv()
+
+SEARCH_API_URL = "https://www.searchapi.io/api/v1/search"
+SEARCH_API_KEY = os.getenv('SEARCH_API_KEY')
+if not SEARCH_API_KEY:
+    raise ValueError("SEARCH_API_KEY not found in environment variables")
+
+BASE_SEARCH_PARAMS = {
+    "engine": "google_jobs",
+    "api_key": SEARCH_API_KEY,
+    "gl": "us",  # Country code for United States
+    "hl": "en",  # Language code for English
+}
+
+# Shared session so concurrent searches and pagination reuse pooled
+# keep-alive connections instead of a new TCP/TLS handshake per request.
+# Retries stay with tenacity on _fetch_page.
+SEARCH_API_TIMEOUT = (3.05, 30)  # (connect, read) seconds
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Every outbound request, including pagination and retries, takes a token
+SEARCH_API_CALLS_PER_MINUTE = 60  # Sustained SearchAPI request budget
+SEARCH_API_BURST = 3  # Requests allowed back-to-back while under budget
+_rate_limiter = RateLimiter(SEARCH_API_CALLS_PER_MINUTE, burst=SEARCH_API_BURST)
+
+# Raw response bodies keyed by query and page, so repeated searches within
+# the TTL skip the API call. Bytes are cached so every hit decodes a fresh dict.
+# First pages change as new postings arrive, so they expire sooner than the
+# pages reached through a pagination token.
+SEARCH_CACHE_TTL_FIRST_PAGE = 900  # Seconds a first-page response is reused
+SEARCH_CACHE_TTL_NEXT_PAGES = 3600  # Seconds a paginated response is reused
+_response_cache = TTLCache(ttl=SEARCH_CACHE_TTL_NEXT_PAGES, maxsize=256)
+
+BULK_WRITE_BATCH_SIZE = 1000  # Max operations sent per bulk_write call
+
+# Threads storing a search's pages while the next page is fetched. PyMongo
+# clients are thread-safe, so storage threads share the process's connection pool.
+STORE_MAX_WORKERS = 4
+
+def _build_base_params(
+    job_title: str,
+    job_location: Optional[str] = None,
+    search_location: Optional[str] = None
+) -> Dict:
+    """
+    Build the request parameters shared by every page of a search.
+    
+    Only `next_page_token` changes between pages, so this runs once per search.
+    """
+    params = {
+        **BASE_SEARCH_PARAMS,
+        "q": f"{job_title} {job_location}" if job_location else job_title,
+    }
+    if search_location:
+        params['location'] = search_location
+    return params
+
+def _page_cache_key(base_params: Dict, next_page_token: Optional[str]) -> Tuple:
+    """Key a cached response by query, geotarget and page."""
+    return (base_params['q'], base_params.get('location'), next_page_token)
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=4, max=10)
 )
+def _fetch_page(
+    base_params: Dict,
+    next_page_token: Optional[str] = None
+) -> Tuple[Dict, Optional[bytes]]:
+    """
+    Fetch one page of results for parameters from `_build_base_params`.
+    
+    Cached responses are served without an API call. Fresh responses are not
+    cached here; the caller passes the returned body to `_cache_page` once the
+    page has validated, so a malformed body is never replayed.
+    
+    Returns:
+        Tuple[Dict, Optional[bytes]]: Decoded response and the raw body, or
+        None for the body when the page came from the cache
+        
+    Raises:
+        requests.RequestException: If API request fails
+    """
+    params = {**base_params, "next_page_token": next_page_token} if next_page_token else base_params
+
+    cached = _response_cache.get(_page_cache_key(base_params, next_page_token))
+    if cached is not None:
+        logger.info("Using cached jobs response", query=params['q'])
+        return from_json(cached), None
+
+    try:
+        logger.info("Fetching jobs", query=params['q'])
+        _rate_limiter.acquire()
+        response = _session.get(SEARCH_API_URL, params=params, timeout=SEARCH_API_TIMEOUT)
+        response.raise_for_status()
+        
+        # Decode the raw bytes with pydantic-core's JSON parser rather than
+        # routing through the stdlib json module
+        return from_json(response.content), response.content
+        
+    except requests.RequestException as e:
+        logger.error("API request failed", error=str(e))
+        raise
+
+def _cache_page(base_params: Dict, next_page_token: Optional[str], body: bytes) -> None:
+    """Cache a response body returned by `_fetch_page` after it has validated."""
+    _response_cache.set(
+        _page_cache_key(base_params, next_page_token),
+        body,
+        ttl=SEARCH_CACHE_TTL_NEXT_PAGES if next_page_token else SEARCH_CACHE_TTL_FIRST_PAGE
+    )
+
 def fetch_jobs_from_api(
     job_title: str,
     job_location: Optional[str] = None,
     search_location: Optional[str] = None,
     next_page_token: Optional[str] = None
-) -> Optional[Dict]:
+) -> Dict:
     """
     Fetch raw job data from SearchAPI.io.
     
@@ -29,42 +146,23 @@ def fetch_jobs_from_api(
         next_page_token (Optional[str]): Token for pagination
         
     Returns:
-        Optional[Dict]: Raw API response data or None if request fails
+        Dict: Raw API response data
         
     Raises:
         requests.RequestException: If API request fails
+        
+    Notes:
+        - Serves cached pages but does not cache new ones, since the raw
+          response is not validated here
     """
-    load_dotenv()
-    
-    api_key = os.getenv('SEARCH_API_KEY')
-    if not api_key:
-        logger.error("SEARCH_API_KEY not found in environment variables")
-        return None
-    
-    url = "https://www.searchapi.io/api/v1/search"
-    params = {
-        "engine": "google_jobs",
-        "q": f"{job_title} {job_location}" if job_location else job_title,
-        "api_key": api_key,
-        "gl": "us",  # Country code for United States
-        "hl": "en",  # Language code for English
-    }
-    
-    if search_location:
-        params['location'] = search_location
-    if next_page_token:
-        params['next_page_token'] = next_page_token
+    raw_response, _ = _fetch_page(
+        _build_base_params(job_title, job_location, search_location),
+        next_page_token
+    )
+    return raw_response
 
-    try:
-        logger.info("Fetching jobs", query=params['q'])
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        return response.json()
-        
-    except requests.RequestException as e:
-        logger.error("API request failed", error=str(e))
-        raise
+# Default for dict.pop that tells a missing key apart from one set to None
+_MISSING = object()
 
 def parse_jobs_response(raw_response: Dict) -> Optional[JobSearchResponse]:
     """
@@ -81,73 +179,109 @@ def parse_jobs_response(raw_response: Dict) -> Optional[JobSearchResponse]:
         - Validates response against JobSearchResponse model
     """
     try:
-        # Remove pagination from raw response before parsing
-        response_data = raw_response.copy()
-        pagination_token = response_data.pop('pagination', {}).get('next_page_token')
+        # Leave pagination out of the parsed model; pop it in place and restore
+        # it afterwards so the caller's dict is unchanged without copying it
+        pagination = raw_response.pop('pagination', _MISSING)
+        try:
+            result = JobSearchResponse.model_validate(raw_response)
+        finally:
+            if pagination is not _MISSING:
+                raw_response['pagination'] = pagination
+        pagination_token = pagination.get('next_page_token') if isinstance(pagination, dict) else None
         
-        # Store pagination token in the function's return context
-        result = JobSearchResponse(**response_data)
         # Attach pagination token as a simple attribute (won't be stored in MongoDB)
         setattr(result, '_next_page_token', pagination_token)
         return result
         
     except Exception as e:
-        logger.error(f"Error parsing job response: {str(e)}")
+        logger.error("Error parsing job response", error=str(e))
         if isinstance(e, ValidationError):
-            logger.error(f"Validation errors: {e.errors()}")
+            logger.error("Validation errors", errors=e.errors())
         return None
 
+def _job_to_document(job: JobListing, search_id: str, created_at: datetime) -> Dict:
+    """
+    Build the MongoDB document for a job listing.
+    
+    Reads the already validated model attributes directly instead of running
+    model_dump, converting only the URL fields to strings for BSON. Includes
+    the `doc_hash` deduplication key used as the upsert filter.
+    """
+    apply_link = str(job.apply_link)
+    return {
+        "doc_hash": job_doc_hash(job.title, job.company_name, job.location, apply_link),
+        "position": job.position,
+        "title": job.title,
+        "company_name": job.company_name,
+        "location": job.location,
+        "via": job.via,
+        "description": job.description,
+        "job_highlights": [highlight.model_dump() for highlight in job.job_highlights] if job.job_highlights is not None else None,
+        "extensions": job.extensions,
+        "detected_extensions": job.detected_extensions.model_dump() if job.detected_extensions is not None else None,
+        "apply_link": apply_link,
+        "apply_links": [{"link": str(link.link), "source": link.source} for link in job.apply_links],
+        "sharing_link": str(job.sharing_link),
+        "thumbnail": job.thumbnail,
+        "search_id": search_id,
+        "created_at": created_at,
+    }
+
 def store_jobs_in_db(parsed_response: JobSearchResponse, search_id: Optional[str] = None) -> bool:
     """Store jobs in MongoDB, updating existing search if search_id provided"""
-    start_time = datetime.now(UTC)
-    try:
-        job_collection = get_jobs_collection()
-        search_collection = get_searches_collection()
-        
-        successful_jobs = 0
-        job_ids = []
-        
-        for job in parsed_response.jobs:
-            try:
-                # Convert to dict and ensure URLs are strings
-                job_dict = job.model_dump()
-                job_dict["apply_link"] = str(job.apply_link)
-                job_dict["sharing_link"] = str(job.sharing_link)
-                job_dict["apply_links"] = [{"link": str(link.link), "source": link.source} for link in job.apply_links]
-                job_dict["search_id"] = search_id or parsed_response.search_metadata.id
-                job_dict["created_at"] = datetime.now(UTC)
-                
-                result = job_collection.update_one(
-                    {
-                        "title": job.title,
-                        "company_name": job.company_name,
-                        "location": job.location,
-                        "apply_link": str(job.apply_link)
-                    },
+    search_id = search_id or parsed_response.search_metadata.id
+    # The span records how long storage took, so no separate clock reads are needed
+    with logger.span("Storing jobs", search_id=search_id):
+        # One timestamp for the whole page
+        created_at = datetime.now(UTC)
+        try:
+            job_collection = get_jobs_collection()
+            
+            operations = []
+            for job in parsed_response.jobs:
+                job_dict = _job_to_document(job, search_id, created_at)
+                operations.append(UpdateOne(
+                    {"doc_hash": job_dict["doc_hash"]},
                     {"$set": job_dict},
                     upsert=True
-                )
-                
-                if result.upserted_id:
-                    job_ids.append(str(result.upserted_id))
-                
-                successful_jobs += 1
-                
-            except Exception as e:
-                logger.error("Error storing job", 
-                            job_title=job.title,
-                            error=str(e))
-                continue
+                ))
+        
+            if not operations:
+                return False
+        
+            # Send the page in as few round trips as possible; unordered so one bad
+            # job doesn't block the rest
+            inserted = modified = 0
+            for offset in range(0, len(operations), BULK_WRITE_BATCH_SIZE):
+                batch = operations[offset:offset + BULK_WRITE_BATCH_SIZE]
+                try:
+                    result = job_collection.bulk_write(batch, ordered=False)
+                    inserted += result.upserted_count
+                    modified += result.modified_count
+                except BulkWriteError as bwe:
+                    details = bwe.details
+                    inserted += details.get("nUpserted", 0)
+                    modified += details.get("nModified", 0)
+                    for write_error in details.get("writeErrors", []):
+                        logger.error("Error storing job",
+                                    job_title=parsed_response.jobs[offset + write_error["index"]].title,
+                                    error=write_error.get("errmsg"))
+                except Exception as db_error:
+                    # Earlier batches are already committed, so still report them
+                    logger.error("Bulk write failed", offset=offset, error=str(db_error))
+                    break
         
-        logger.info("Storage metrics", 
-                   processed=len(parsed_response.jobs),
-                   stored=successful_jobs,
-                   duration=str(datetime.now(UTC) - start_time))
-        return successful_jobs > 0
+            successful_jobs = inserted + modified
+            logger.info("Storage metrics", 
+                       processed=len(parsed_response.jobs),
+                       stored=successful_jobs,
+                       inserted=inserted,
+                       modified=modified)
+            return successful_jobs > 0
         
-    except Exception as db_error:
-        logger.error("Database operation error", error=str(db_error))
-        return False
+        except Exception as db_error:
+            logger.error("Database operation error", error=str(db_error))
+            return False
 
 def process_job_search(
     job_title: str,
@@ -177,63 +311,66 @@ def process_job_search(
     next_page_token = None
     search_info = None
     search_id = None
+    store_futures: List[Future] = []
 
     logger.info("Starting job search", 
                 job_title=job_title, 
                 location=job_location, 
                 max_pages=max_page_depth)
     
-    while pages_processed < max_page_depth:
-        try:
-            raw_response = fetch_jobs_from_api(
-                job_title=job_title,
-                job_location=job_location,
-                next_page_token=next_page_token
-            )
-            
-            if raw_response is None:
-                logger.error("Failed to fetch response from API")
-                break
+    base_params = _build_base_params(job_title, job_location)
+    # Created per search rather than at import so a forked worker never
+    # inherits an executor whose threads did not survive the fork
+    with ThreadPoolExecutor(max_workers=STORE_MAX_WORKERS, thread_name_prefix="job-store") as store_pool:
+        while pages_processed < max_page_depth:
+            try:
+                raw_response, raw_body = _fetch_page(base_params, next_page_token)
             
-            if pages_processed == 0:
-                search_info = raw_response.get('search_information', {})
-                if 'search_metadata' not in raw_response:
-                    logger.error("Invalid API response", error="missing search_metadata")
-                    break
-                search_id = raw_response['search_metadata']['id']
-            else:
-                raw_response['search_information'] = search_info
-                raw_response['is_subsequent_page'] = True
+                if pages_processed == 0:
+                    search_info = raw_response.get('search_information', {})
+                    if 'search_metadata' not in raw_response:
+                        logger.error("Invalid API response", error="missing search_metadata")
+                        break
+                    search_id = raw_response['search_metadata']['id']
+                else:
+                    raw_response['search_information'] = search_info
+                    raw_response['is_subsequent_page'] = True
             
-            parsed_response = JobSearchResponse(**raw_response)
+                parsed_response = JobSearchResponse.model_validate(raw_response)
+                if raw_body is not None:
+                    _cache_page(base_params, next_page_token, raw_body)
             
-            if not store_jobs_in_db(parsed_response, search_id):
-                storage_success = False
-                logger.warning("Failed to store some jobs", search_id=search_id)
+                # Store in the background so the next page's fetch overlaps the write
+                store_futures.append(store_pool.submit(store_jobs_in_db, parsed_response, search_id))
             
-            total_jobs += len(parsed_response.jobs)
-            next_page_token = raw_response.get('pagination', {}).get('next_page_token')
+                total_jobs += len(parsed_response.jobs)
+                next_page_token = raw_response.get('pagination', {}).get('next_page_token')
             
-            logger.info("Page processed", 
-                       jobs_found=len(parsed_response.jobs),
-                       page_number=pages_processed + 1,
-                       has_next_page=bool(next_page_token))
+                logger.info("Page processed", 
+                           jobs_found=len(parsed_response.jobs),
+                           page_number=pages_processed + 1,
+                           has_next_page=bool(next_page_token))
             
-            if not next_page_token:
-                logger.info("No more pages available")
-                break
+                if not next_page_token:
+                    logger.info("No more pages available")
+                    break
                 
-            pages_processed += 1
+                pages_processed += 1
             
-            if pages_processed >= max_page_depth:
-                logger.info("Reached max page depth", max_depth=max_page_depth)
-                break
+                if pages_processed >= max_page_depth:
+                    logger.info("Reached max page depth", max_depth=max_page_depth)
+                    break
                 
-        except Exception as e:
-            logger.error("Error processing page", 
-                        page_number=pages_processed + 1,
-                        error=str(e))
-            break
+            except Exception as e:
+                logger.error("Error processing page", 
+                            page_number=pages_processed + 1,
+                            error=str(e))
+                break
+    
+        for future in store_futures:
+            if not future.result():
+                storage_success = False
+                logger.warning("Failed to store some jobs", search_id=search_id)
     
     logger.info("Job search completed", 
                 total_jobs=total_jobs,
@@ -1,7 +1,26 @@
 import logfire
 import os
+import warnings
 from dotenv import load_dotenv
 
+# Console levels logfire accepts for min_log_level
+LOG_LEVELS = ('trace', 'debug', 'info', 'notice', 'warn', 'error', 'fatal')
+
+def _console_log_level() -> str:
+    """
+    Read the minimum console log level from LOGFIRE_LEVEL.
+    
+    Matched case-insensitively, so "INFO" and "WARNING" work. Unknown values
+    fall back to "info" with a warning instead of failing at import.
+    """
+    level = os.getenv('LOGFIRE_LEVEL', 'info').lower()
+    if level == 'warning':
+        level = 'warn'
+    if level not in LOG_LEVELS:
+        warnings.warn(f"Unknown LOGFIRE_LEVEL {level!r}, using 'info'")
+        return 'info'
+    return level
+
 def setup_logger():
     """
     Configure Logfire logger for PathAtlas.
@@ -13,7 +32,10 @@ def setup_logger():
         token=os.getenv('LOGFIRE_TOKEN'),
         service_name="path-atlas",
         service_version="1.0.0",
-        environment=os.getenv('ENVIRONMENT', 'development')
+        environment=os.getenv('ENVIRONMENT', 'development'),
+        # Drop console output below this level; raise it (e.g. "warn") in
+        # production to keep per-page info logs off the console
+        console=logfire.ConsoleOptions(min_log_level=_console_log_level())
     )
     
     return logfire
@@ -0,0 +1,31 @@
+import threading
+import time
+
+class RateLimiter:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Tokens refill at `calls_per_minute / 60` per second up to `burst`. Calls
+    proceed immediately while tokens remain and only wait once the bucket is
+    drained. Callers reserve their token under a lock and sleep outside it, so
+    concurrent workers queue up behind each other without holding the lock.
+    """
+    
+    def __init__(self, calls_per_minute: float, burst: int = 1):
+        self.rate = calls_per_minute / 60
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            # A negative balance is a reservation on tokens still to be refilled
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)